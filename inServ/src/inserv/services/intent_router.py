@@ -4,7 +4,6 @@ import logging
 from typing import Optional
 
 import requests
-from inserv.services.turtle_parser import TurtleParser
 
 
 class IntentRouter:
@@ -17,7 +16,15 @@ class IntentRouter:
         self._innet_base_url = innet_base_url.rstrip("/")
         self._innet_ready = innet_ready
         self._graphdb_client = graphdb_client
-        self._turtle_parser = TurtleParser()
+        self._turtle_parser_instance = None
+
+    @property
+    def _turtle_parser(self):
+        """Get or create the turtle parser (imported lazily so rdflib loads on first use, not at app startup)."""
+        if self._turtle_parser_instance is None:
+            from inserv.services.turtle_parser import TurtleParser
+            self._turtle_parser_instance = TurtleParser()
+        return self._turtle_parser_instance
 
     def route_intent(
         self, intent_data: dict, datacenter: str
@@ -1,9 +1,71 @@
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
+from functools import lru_cache
+from itertools import chain
 from typing import Optional, List, Tuple
-from rdflib import Graph, URIRef, Literal
-from rdflib.namespace import RDF
+from rdflib import BNode, Graph, URIRef, Literal
+from rdflib.exceptions import ParserError
+from rdflib.namespace import RDF, XSD
+from rdflib.plugins.sparql import prepareQuery
+
+try:
+    import pyoxigraph
+except ImportError:
+    pyoxigraph = None  # type: ignore
+
+_XSD_STRING = str(XSD.string)
+
+# Same logger name as the former per-instance getLogger(self.__class__.__name__)
+_LOGGER = logging.getLogger("TurtleParser")
+
+
+def _oxigraph_term_to_rdflib(term):
+    """Convert a pyoxigraph term to the equivalent rdflib term."""
+    if isinstance(term, pyoxigraph.NamedNode):
+        return URIRef(term.value)
+    if isinstance(term, pyoxigraph.BlankNode):
+        return BNode(term.value)
+    if term.language:
+        return Literal(term.value, lang=term.language)
+    # rdflib's Turtle parser keeps plain strings untyped rather than xsd:string
+    if term.datatype.value == _XSD_STRING:
+        return Literal(term.value)
+    return Literal(term.value, datatype=URIRef(term.datatype.value))
+
+
+def _parse_with_oxigraph(turtle_data: str, graph: Graph) -> None:
+    """Parse Turtle with the Rust-backed pyoxigraph parser and load the triples into graph."""
+    parser = pyoxigraph.parse(turtle_data, format=pyoxigraph.RdfFormat.TURTLE)
+    graph.addN(
+        (
+            _oxigraph_term_to_rdflib(quad.subject),
+            _oxigraph_term_to_rdflib(quad.predicate),
+            _oxigraph_term_to_rdflib(quad.object),
+            graph,
+        )
+        for quad in parser
+    )
+    # Prefixes are only known once the whole document has been read
+    for prefix, namespace in getattr(parser, "prefixes", {}).items():
+        graph.bind(prefix, namespace, override=False)
+
+
+class _GraphIndex:
+    """Triples of a graph grouped by subject (spo) and by object (ops), built in one pass."""
+
+    __slots__ = ("spo", "ops")
+
+    def __init__(self, graph: Graph):
+        spo = defaultdict(list)
+        ops = defaultdict(list)
+        for triple in graph:
+            spo[triple[0]].append(triple)
+            ops[triple[2]].append(triple)
+        # Plain dicts, so lookups of unknown terms never add keys ("in spo" means "is a subject")
+        self.spo = dict(spo)
+        self.ops = dict(ops)
 
 
 class TurtleParser:
@@ -13,8 +75,147 @@ class TurtleParser:
     DATA5G_NS = "http://5g4data.eu/5g4data#"
     ICM_NS = "http://tio.models.tmforum.org/tio/v3.6.0/IntentCommonModel/"
 
+    # Errors raised for malformed Turtle input; anything else is a bug and propagates.
+    # rdflib's BadSyntax and pyoxigraph's parse errors are both SyntaxError subclasses.
+    _PARSE_ERRORS = (SyntaxError, ParserError)
+
+    # Graphs here are short-lived parse-and-query scratch space; the plain
+    # triple-indexed store skips the context bookkeeping of the default one
+    _GRAPH_STORE = "SimpleMemory"
+
+    # Frequently used terms, built once instead of on every call
+    _NE = URIRef(DATA5G_NS + "NetworkExpectation")
+    _DE = URIRef(DATA5G_NS + "DeploymentExpectation")
+    _RE = URIRef(ICM_NS + "ReportingExpectation")
+    _CONTEXT = URIRef(ICM_NS + "Context")
+    _DEPLOYMENT_DESCRIPTOR = URIRef(DATA5G_NS + "DeploymentDescriptor")
+    _APPLICATION = URIRef(DATA5G_NS + "Application")
+    _DATACENTER = URIRef(DATA5G_NS + "DataCenter")
+    _DERIVED_FROM = URIRef(DATA5G_NS + "derivedFrom")
+    _LOG_ALLOF = URIRef("http://tio.models.tmforum.org/tio/v3.6.0/LogicalOperators/allOf")
+    _IMO_HANDLER = URIRef("http://tio.models.tmforum.org/tio/v3.6.0/IntentManagementOntology/handler")
+    _IMO_OWNER = URIRef("http://tio.models.tmforum.org/tio/v3.6.0/IntentManagementOntology/owner")
+
+    # Intent-node predicates the split sets afresh on each output intent
+    _SPLIT_REPLACED_PREDICATES = frozenset((_IMO_HANDLER, _IMO_OWNER, _LOG_ALLOF))
+
+    # Handler/owner values written on the split intents
+    _INNET = Literal("inNet")
+    _INORCH = Literal("inOrch")
+    _INSERV = Literal("inServ")
+
+    # Properties _extract_property can read, keyed by local name
+    _PROPERTY_URIS = {
+        "DeploymentDescriptor": _DEPLOYMENT_DESCRIPTOR,
+        "Application": _APPLICATION,
+    }
+
+    # Single query returning (subject, type) rows for NE, DE and RE nodes
+    _EXPECTATIONS_QUERY = prepareQuery(f"""
+        PREFIX data5g: <{DATA5G_NS}>
+        PREFIX icm: <{ICM_NS}>
+        SELECT ?s ?t WHERE {{
+            VALUES ?t {{ data5g:NetworkExpectation data5g:DeploymentExpectation icm:ReportingExpectation }}
+            ?s a ?t .
+        }}
+    """)
+
+    # Intent node: the subject typed as both icm:Intent and icm:IntentElement
+    _INTENT_NODE_QUERY = prepareQuery(f"""
+        PREFIX icm: <{ICM_NS}>
+        SELECT ?s WHERE {{ ?s a icm:Intent, icm:IntentElement . }} LIMIT 1
+    """)
+
+    # DeploymentExpectation -> log:allOf -> Context with DeploymentDescriptor and Application
+    _DEPLOYMENT_INFO_QUERY = prepareQuery(f"""
+        PREFIX data5g: <{DATA5G_NS}>
+        PREFIX icm: <{ICM_NS}>
+        PREFIX log: <http://tio.models.tmforum.org/tio/v3.6.0/LogicalOperators/>
+        SELECT ?desc ?app WHERE {{
+            ?de a data5g:DeploymentExpectation ;
+                log:allOf ?ctx .
+            ?ctx a icm:Context ;
+                data5g:DeploymentDescriptor ?desc ;
+                data5g:Application ?app .
+            FILTER(!isBlank(?desc) && !isBlank(?app))
+        }}
+    """)
+
+    # Prefixes bound on the graph being split (and therefore offered to the split output graphs)
+    _KNOWN_PREFIXES = {
+        "data5g": DATA5G_NS,
+        "dct": "http://purl.org/dc/terms/",
+        "dcterms": "http://purl.org/dc/terms/",
+        "icm": ICM_NS,
+        "imo": "http://tio.models.tmforum.org/tio/v3.6.0/IntentManagementOntology/",
+        "log": "http://tio.models.tmforum.org/tio/v3.6.0/LogicalOperators/",
+        "quan": "http://tio.models.tmforum.org/tio/v3.6.0/QuantityOntology/",
+        "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
+        "set": "http://tio.models.tmforum.org/tio/v3.6.0/SetOperators/",
+        "xsd": "http://www.w3.org/2001/XMLSchema#",
+        "geo": "http://www.opengis.net/ont/geosparql#",
+    }
+
+    # Recognised (lower-cased) time units for p99-token-target
+    _MILLISECOND_UNITS = frozenset(("ms", "millisecond", "milliseconds"))
+    _SECOND_UNITS = frozenset(("s", "sec", "second", "seconds"))
+
+    # p99-token-target constraint: Condition -> set:forAll -> quan:smaller -> rdf:value / quan:unit
+    _P99_TOKEN_TARGET_QUERY = prepareQuery(f"""
+        PREFIX icm: <{ICM_NS}>
+        PREFIX quan: <http://tio.models.tmforum.org/tio/v3.6.0/QuantityOntology/>
+        PREFIX set: <http://tio.models.tmforum.org/tio/v3.6.0/SetOperators/>
+        PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
+        SELECT ?target ?value ?unit WHERE {{
+            ?condition a icm:Condition ;
+                set:forAll ?forall .
+            ?forall icm:valuesOfTargetProperty ?target ;
+                quan:smaller ?smaller .
+            FILTER(CONTAINS(STR(?target), "p99-token-target"))
+            ?smaller rdf:value ?value .
+            FILTER(isLiteral(?value))
+            OPTIONAL {{
+                ?smaller quan:unit ?unit .
+                FILTER(isLiteral(?unit))
+            }}
+        }}
+    """)
+
     def __init__(self):
-        self._logger = logging.getLogger(self.__class__.__name__)
+        self._logger = _LOGGER
+
+    def _parse_graph(self, turtle_data: str, bind_known_prefixes: bool = False) -> Graph:
+        """
+        Parse Turtle data into a new graph.
+
+        Uses pyoxigraph's native parser when it is installed and falls back to
+        rdflib's pure-Python Turtle parser otherwise. Queries use full URIs, so
+        the known prefixes are only bound when the caller serializes from the graph.
+        """
+        graph = Graph(store=self._GRAPH_STORE)
+        if pyoxigraph is not None:
+            _parse_with_oxigraph(turtle_data, graph)
+        else:
+            graph.parse(data=turtle_data, format="turtle")
+        if bind_known_prefixes:
+            for prefix, namespace in self._KNOWN_PREFIXES.items():
+                graph.bind(prefix, namespace, override=False)
+        return graph
+
+    def _used_namespaces(self, namespaces: List[Tuple[str, URIRef]], triples: set) -> List[Tuple[str, URIRef]]:
+        """Return the (prefix, namespace) pairs whose namespace is used by an IRI in the triples."""
+        # The intent node predicates are (re)written after the triples are copied
+        iris = {self._IMO_HANDLER, self._IMO_OWNER, self._DERIVED_FROM, self._LOG_ALLOF}
+        for triple in triples:
+            for term in triple:
+                if isinstance(term, URIRef):
+                    iris.add(term)
+                elif isinstance(term, Literal) and term.datatype is not None:
+                    iris.add(term.datatype)
+        return [
+            (prefix, namespace) for prefix, namespace in namespaces
+            if any(iri.startswith(namespace) for iri in iris)
+        ]
 
     def parse_deployment_info(self, turtle_data: str) -> Optional[dict]:
         """
@@ -28,12 +229,16 @@ class TurtleParser:
         Returns None if no deployment information is found.
         """
         try:
-            graph = Graph()
-            graph.parse(data=turtle_data, format="turtle")
-            
-            # Bind namespaces for easier querying (if not already bound)
-            graph.bind("data5g", self.DATA5G_NS, override=False)
-            
+            graph = self._parse_graph(turtle_data)
+
+            # Fast path: resolve DE -> Context -> descriptor/application with one prepared query
+            for row in graph.query(self._DEPLOYMENT_INFO_QUERY):
+                deployment_descriptor = str(row.desc)
+                application = str(row.app)
+                if deployment_descriptor and application:
+                    return self._deployment_info_result(deployment_descriptor, application)
+
+            # No complete match: walk the graph step by step to report what is missing
             # Check for DeploymentExpectation
             deployment_expectation = self._find_deployment_expectation(graph)
             if not deployment_expectation:
@@ -58,85 +263,72 @@ class TurtleParser:
                 self._logger.warning("Context found but no Application name")
                 return None
 
-            result = {
-                "deployment_descriptor": deployment_descriptor,
-                "application": application,
-                "has_deployment_expectation": True,
-            }
+            return self._deployment_info_result(deployment_descriptor, application)
 
-            self._logger.info(
-                "Extracted deployment info: app=%s, chart=%s",
-                application,
-                deployment_descriptor,
-            )
-            return result
-
-        except Exception as exc:
+        except self._PARSE_ERRORS as exc:
             self._logger.error("Failed to parse Turtle RDF data: %s", exc, exc_info=True)
             return None
 
+    def _deployment_info_result(self, deployment_descriptor: str, application: str) -> dict:
+        """Build (and log) the parse_deployment_info result dictionary."""
+        self._logger.info(
+            "Extracted deployment info: app=%s, chart=%s",
+            application,
+            deployment_descriptor,
+        )
+        return {
+            "deployment_descriptor": deployment_descriptor,
+            "application": application,
+            "has_deployment_expectation": True,
+        }
+
     def _find_deployment_expectation(self, graph: Graph) -> Optional[URIRef]:
         """Find the DeploymentExpectation node in the graph."""
-        data5g_deployment_expectation = URIRef(f"{self.DATA5G_NS}DeploymentExpectation")
-        
-        # Query for subjects that are of type DeploymentExpectation
-        for subject in graph.subjects(RDF.type, data5g_deployment_expectation):
+        # Query for the first subject of type DeploymentExpectation
+        subject = next(graph.subjects(RDF.type, self._DE), None)
+        if subject is not None:
             self._logger.debug("Found DeploymentExpectation: %s", subject)
-            return subject
-        
-        return None
+        return subject
 
     def find_network_expectation(self, turtle_data: str) -> Optional[URIRef]:
         """Find the NetworkExpectation node in the Turtle data."""
         try:
-            graph = Graph()
-            graph.parse(data=turtle_data, format="turtle")
-            graph.bind("data5g", self.DATA5G_NS, override=False)
-            
-            data5g_network_expectation = URIRef(f"{self.DATA5G_NS}NetworkExpectation")
+            graph = self._parse_graph(turtle_data)
             
-            # Query for subjects that are of type NetworkExpectation
-            for subject in graph.subjects(RDF.type, data5g_network_expectation):
+            # Query for the first subject of type NetworkExpectation
+            subject = next(graph.subjects(RDF.type, self._NE), None)
+            if subject is not None:
                 self._logger.debug("Found NetworkExpectation: %s", subject)
-                return subject
-            
-            return None
-        except Exception as exc:
-            self._logger.error("Failed to find NetworkExpectation: %s", exc, exc_info=True)
+            return subject
+        except self._PARSE_ERRORS as exc:
+            self._logger.error("Failed to find NetworkExpectation: %s", exc)
             return None
 
     def find_deployment_expectation(self, turtle_data: str) -> Optional[URIRef]:
         """Find the DeploymentExpectation node in the Turtle data."""
         try:
-            graph = Graph()
-            graph.parse(data=turtle_data, format="turtle")
-            graph.bind("data5g", self.DATA5G_NS, override=False)
+            graph = self._parse_graph(turtle_data)
             
             return self._find_deployment_expectation(graph)
-        except Exception as exc:
-            self._logger.error("Failed to find DeploymentExpectation: %s", exc, exc_info=True)
+        except self._PARSE_ERRORS as exc:
+            self._logger.error("Failed to find DeploymentExpectation: %s", exc)
             return None
 
     def find_requirement_expectations(self, turtle_data: str) -> List[URIRef]:
         """Find all ReportingExpectation nodes in the Turtle data."""
         try:
-            graph = Graph()
-            graph.parse(data=turtle_data, format="turtle")
-            graph.bind("data5g", self.DATA5G_NS, override=False)
-            graph.bind("icm", self.ICM_NS, override=False)
-            
-            # REs use icm:ReportingExpectation, not data5g:RequirementExpectation
-            icm_reporting_expectation = URIRef(f"{self.ICM_NS}ReportingExpectation")
+            graph = self._parse_graph(turtle_data)
             
             # Query for all subjects that are of type ReportingExpectation
-            requirements = list(graph.subjects(RDF.type, icm_reporting_expectation))
+            # REs use icm:ReportingExpectation, not data5g:RequirementExpectation
+            requirements = list(graph.subjects(RDF.type, self._RE))
             
             if requirements:
                 self._logger.debug("Found %d ReportingExpectation(s)", len(requirements))
             
             return requirements
-        except Exception as exc:
-            self._logger.error("Failed to find ReportingExpectations: %s", exc, exc_info=True)
+        except self._PARSE_ERRORS as exc:
+            self._logger.error("Failed to find ReportingExpectations: %s", exc)
             return []
 
     def find_all_expectations(self, turtle_data: str) -> Tuple[Optional[URIRef], Optional[URIRef], List[URIRef]]:
@@ -162,36 +354,31 @@ class TurtleParser:
         """
         # The expectation references the context via log:allOf
         # We need to find a Context that is referenced by the expectation
-        log_allof = URIRef("http://tio.models.tmforum.org/tio/v3.6.0/LogicalOperators/allOf")
-        icm_context = URIRef(f"{self.ICM_NS}Context")
-        data5g_deployment_descriptor = URIRef(f"{self.DATA5G_NS}DeploymentDescriptor")
+        # Contexts carrying a DeploymentDescriptor, computed once from the type and predicate indices
+        contexts_with_descriptor = set(
+            graph.subjects(self._DEPLOYMENT_DESCRIPTOR, None)
+        ) & set(graph.subjects(RDF.type, self._CONTEXT))
 
         # Find all objects referenced by the expectation via log:allOf
-        referenced_objects = list(graph.objects(expectation, log_allof))
-        
-        # Check each referenced object to see if it's a Context with DeploymentDescriptor
-        for obj in referenced_objects:
-            # Check if this object is a Context
-            if (obj, RDF.type, icm_context) in graph:
-                # Check if it has a DeploymentDescriptor
-                if (obj, data5g_deployment_descriptor, None) in graph:
-                    self._logger.debug("Found Context with DeploymentDescriptor: %s", obj)
-                    return obj
+        for obj in graph.objects(expectation, self._LOG_ALLOF):
+            if obj in contexts_with_descriptor:
+                self._logger.debug("Found Context with DeploymentDescriptor: %s", obj)
+                return obj
         
         return None
 
     def _extract_property(
         self, graph: Graph, subject: URIRef, property_name: str
     ) -> Optional[str]:
-        """Extract a property value from the graph for the given subject."""
-        property_uri = URIRef(f"{self.DATA5G_NS}{property_name}")
-        
-        # Get the object value
-        for obj in graph.objects(subject, property_uri):
-            if isinstance(obj, Literal):
-                return str(obj)
-            elif isinstance(obj, URIRef):
-                return str(obj)
+        """
+        Extract a property value from the graph for the given subject.
+
+        property_name must be one of the keys of _PROPERTY_URIS.
+        """
+        # Only the first value is used, so take it directly instead of iterating
+        obj = graph.value(subject, self._PROPERTY_URIS[property_name], any=True)
+        if isinstance(obj, (Literal, URIRef)):
+            return str(obj)
         
         return None
 
@@ -204,18 +391,12 @@ class TurtleParser:
         Returns the DataCenter identifier (e.g., "EC21", "EC1"), or None if not found.
         """
         try:
-            graph = Graph()
-            graph.parse(data=turtle_data, format="turtle")
-            graph.bind("data5g", self.DATA5G_NS, override=False)
-            graph.bind("icm", self.ICM_NS, override=False)
-            
-            icm_context = URIRef(f"{self.ICM_NS}Context")
-            data5g_datacenter = URIRef(f"{self.DATA5G_NS}DataCenter")
+            graph = self._parse_graph(turtle_data)
             
             # Find all Context nodes
-            for context in graph.subjects(RDF.type, icm_context):
+            for context in graph.subjects(RDF.type, self._CONTEXT):
                 # Check if this context has a DataCenter property
-                for datacenter_obj in graph.objects(context, data5g_datacenter):
+                for datacenter_obj in graph.objects(context, self._DATACENTER):
                     if isinstance(datacenter_obj, Literal):
                         datacenter = str(datacenter_obj)
                         self._logger.debug("Extracted DataCenter: %s", datacenter)
@@ -228,8 +409,8 @@ class TurtleParser:
             self._logger.debug("No DataCenter found in Turtle data")
             return None
             
-        except Exception as exc:
-            self._logger.error("Failed to extract DataCenter from Turtle: %s", exc, exc_info=True)
+        except self._PARSE_ERRORS as exc:
+            self._logger.error("Failed to extract DataCenter from Turtle: %s", exc)
             return None
 
     def parse_p99_token_target(self, turtle_data: str) -> Optional[float]:
@@ -242,83 +423,40 @@ class TurtleParser:
         Returns the value in seconds (converts from ms if needed), or None if not found.
         """
         try:
-            graph = Graph()
-            graph.parse(data=turtle_data, format="turtle")
-            graph.bind("data5g", self.DATA5G_NS, override=False)
-            graph.bind("icm", self.ICM_NS, override=False)
-            graph.bind("quan", "http://tio.models.tmforum.org/tio/v3.6.0/QuantityOntology/", override=False)
-            graph.bind("set", "http://tio.models.tmforum.org/tio/v3.6.0/SetOperators/", override=False)
-            
-            icm_condition = URIRef(f"{self.ICM_NS}Condition")
-            set_forall = URIRef("http://tio.models.tmforum.org/tio/v3.6.0/SetOperators/forAll")
-            icm_values_of_target_prop = URIRef(f"{self.ICM_NS}valuesOfTargetProperty")
-            quan_smaller = URIRef("http://tio.models.tmforum.org/tio/v3.6.0/QuantityOntology/smaller")
-            quan_unit = URIRef("http://tio.models.tmforum.org/tio/v3.6.0/QuantityOntology/unit")
-            rdf_value = URIRef("http://www.w3.org/1999/02/22-rdf-syntax-ns#value")
-            
-            # Find all Conditions
-            for condition in graph.subjects(RDF.type, icm_condition):
-                # Check if this condition has a forAll that references p99-token-target
-                forall_objects = list(graph.objects(condition, set_forall))
-                
-                for forall_obj in forall_objects:
-                    # Check if this forAll has valuesOfTargetProperty pointing to p99-token-target
-                    target_props = list(graph.objects(forall_obj, icm_values_of_target_prop))
-                    
-                    for target_prop in target_props:
-                        target_prop_str = str(target_prop)
-                        # Check if it contains p99-token-target
-                        if "p99-token-target" in target_prop_str:
-                            self._logger.debug(
-                                "Found p99-token-target condition: %s",
-                                target_prop_str
-                            )
-                            
-                            # Find the quan:smaller constraint
-                            smaller_objects = list(graph.objects(forall_obj, quan_smaller))
-                            
-                            for smaller_obj in smaller_objects:
-                                # Extract the value and unit
-                                value = None
-                                unit = None
-                                
-                                # Get the value
-                                for val_obj in graph.objects(smaller_obj, rdf_value):
-                                    if isinstance(val_obj, Literal):
-                                        try:
-                                            value = float(val_obj)
-                                        except (ValueError, TypeError):
-                                            continue
-                                
-                                # Get the unit
-                                for unit_obj in graph.objects(smaller_obj, quan_unit):
-                                    if isinstance(unit_obj, Literal):
-                                        unit = str(unit_obj).lower()
-                                
-                                if value is not None:
-                                    # Convert to seconds if unit is ms
-                                    if unit == "ms":
-                                        value_seconds = value / 1000.0
-                                    elif unit == "s" or unit == "sec" or unit == "seconds":
-                                        value_seconds = value
-                                    else:
-                                        # Default to seconds if unit is unknown
-                                        value_seconds = value
-                                        self._logger.warning(
-                                            "Unknown unit '%s' for p99-token-target, assuming seconds",
-                                            unit
-                                        )
-                                    
-                                    self._logger.info(
-                                        "Extracted p99-token-target: %.3f %s (%.3f seconds)",
-                                        value,
-                                        unit or "unknown",
-                                        value_seconds
-                                    )
-                                    return value_seconds
+            graph = self._parse_graph(turtle_data)
+            
+            # Resolve Condition -> forAll -> quan:smaller -> value/unit in one query
+            for row in graph.query(self._P99_TOKEN_TARGET_QUERY):
+                try:
+                    value = float(row.value)
+                except (ValueError, TypeError):
+                    continue
+                unit = str(row.unit).lower() if row.unit is not None else None
+                self._logger.debug("Found p99-token-target condition: %s", row.target)
+
+                # Convert to seconds if unit is ms
+                if unit in self._MILLISECOND_UNITS:
+                    value_seconds = value / 1000.0
+                elif unit in self._SECOND_UNITS:
+                    value_seconds = value
+                else:
+                    # Default to seconds if unit is unknown
+                    value_seconds = value
+                    self._logger.warning(
+                        "Unknown unit '%s' for p99-token-target, assuming seconds",
+                        unit
+                    )
+
+                self._logger.info(
+                    "Extracted p99-token-target: %.3f %s (%.3f seconds)",
+                    value,
+                    unit or "unknown",
+                    value_seconds
+                )
+                return value_seconds
             
             return None
-        except Exception as exc:
+        except self._PARSE_ERRORS as exc:
             self._logger.warning("Failed to extract p99-token-target from Turtle: %s", exc)
             return None
 
@@ -336,57 +474,54 @@ class TurtleParser:
             
         Raises:
             ValueError: If the intent cannot be split (missing expectations, etc.)
+        
+        The split is a pure function of turtle_data (the new intent IDs derive from
+        the original one), so results are memoized and retried or repeated intents
+        skip the parse/copy/serialize work.
         """
+        return _split_turtle_intent_cached(turtle_data)
+
+    def _split_turtle_intent(
+        self, turtle_data: str
+    ) -> Tuple[str, str]:
+        """Uncached implementation of split_turtle_intent."""
         try:
-            graph = Graph()
-            graph.parse(data=turtle_data, format="turtle")
-            graph.bind("data5g", self.DATA5G_NS, override=False)
-            graph.bind("icm", self.ICM_NS, override=False)
-            graph.bind("log", "http://tio.models.tmforum.org/tio/v3.6.0/LogicalOperators/", override=False)
+            # The source graph's bindings seed the split graphs' prefixes
+            graph = self._parse_graph(turtle_data, bind_known_prefixes=True)
+            # Debug-only listings below build lists/strings, so only do that work when DEBUG is on
+            debug_enabled = self._logger.isEnabledFor(logging.DEBUG)
             
             # Find all expectations - but we need to use URIRefs from the parsed graph, not from re-parsing
             # So find them directly in the graph we just parsed
-            data5g_network_expectation = URIRef(f"{self.DATA5G_NS}NetworkExpectation")
-            data5g_deployment_expectation = URIRef(f"{self.DATA5G_NS}DeploymentExpectation")
+            # Look up all three expectation types in one query and bucket the rows by type
             # REs use icm:ReportingExpectation, not data5g:RequirementExpectation
-            icm_reporting_expectation = URIRef(f"{self.ICM_NS}ReportingExpectation")
-            
-            # Find expectations in the parsed graph
             ne = None
-            for subject in graph.subjects(RDF.type, data5g_network_expectation):
-                ne = subject
-                break
-            
             de = None
-            for subject in graph.subjects(RDF.type, data5g_deployment_expectation):
-                de = subject
-                break
-            
             re_list = []
-            for subject in graph.subjects(RDF.type, icm_reporting_expectation):
-                re_list.append(subject)
-            
-            self._logger.debug(
-                "Found expectations: NE=%s, DE=%s, REs=%d: %s",
-                ne,
-                de,
-                len(re_list),
-                [str(re) for re in re_list]
-            )
+            for subject, expectation_type in graph.query(self._EXPECTATIONS_QUERY):
+                if expectation_type == self._NE:
+                    if ne is None:
+                        ne = subject
+                elif expectation_type == self._DE:
+                    if de is None:
+                        de = subject
+                else:
+                    re_list.append(subject)
+
+            if debug_enabled:
+                self._logger.debug(
+                    "Found expectations: NE=%s, DE=%s, REs=%d: %s",
+                    ne,
+                    de,
+                    len(re_list),
+                    [str(re) for re in re_list]
+                )
             
             if not ne or not de:
                 raise ValueError("Cannot split intent: both NetworkExpectation and DeploymentExpectation must be present")
             
-            # Find the Intent node
-            icm_intent = URIRef(f"{self.ICM_NS}Intent")
-            icm_intent_element = URIRef(f"{self.ICM_NS}IntentElement")
-            intent_node = None
-            
             # Find the Intent node (subject that is both Intent and IntentElement)
-            for subject in graph.subjects(RDF.type, icm_intent):
-                if (subject, RDF.type, icm_intent_element) in graph:
-                    intent_node = subject
-                    break
+            intent_node = next((row.s for row in graph.query(self._INTENT_NODE_QUERY)), None)
             
             if not intent_node:
                 raise ValueError("Cannot split intent: Intent node not found")
@@ -405,35 +540,37 @@ class TurtleParser:
                 intent_node
             )
             
-            # Get log:allOf property from intent
-            log_allof = URIRef("http://tio.models.tmforum.org/tio/v3.6.0/LogicalOperators/allOf")
+            # Index the graph by subject and by object once, so the entity and blank node walks
+            # below are served from dict lookups instead of repeated graph pattern scans
+            index = _GraphIndex(graph)
+            spo = index.spo
+            ops = index.ops
             
             # Helper function to collect all entities referenced transitively via log:allOf and properties
             def collect_referenced_entities(start_entity: URIRef, visited: set = None) -> set:
-                """Recursively collect all entities referenced via log:allOf and other properties."""
+                """Collect all entities referenced via log:allOf and other properties (iterative worklist)."""
                 if visited is None:
                     visited = set()
-                if start_entity in visited:
-                    return visited
-                visited.add(start_entity)
-                
-                # Get all entities referenced via log:allOf
-                for referenced in graph.objects(start_entity, log_allof):
-                    if isinstance(referenced, URIRef):
-                        collect_referenced_entities(referenced, visited)
-                
-                # Also collect entities referenced via other properties (like data5g:appliesToRegion)
-                # This ensures we get geo:Feature and other related entities
-                # Get all triples where start_entity is subject
-                for _, predicate, obj in graph.triples((start_entity, None, None)):
-                    if isinstance(obj, URIRef) and obj not in visited:
+                stack = [start_entity]
+                while stack:
+                    entity = stack.pop()
+                    if entity in visited:
+                        continue
+                    visited.add(entity)
+
+                    # Get all triples where entity is subject
+                    for _, predicate, obj in spo.get(entity, ()):
+                        if not isinstance(obj, URIRef):
+                            continue
+                        # Get all entities referenced via log:allOf
+                        if predicate == self._LOG_ALLOF:
+                            stack.append(obj)
+                        # Also collect entities referenced via other properties (like data5g:appliesToRegion)
                         # Check if it's a reference to another entity (appears as subject in graph)
                         # This catches properties like appliesToRegion -> geo:Feature
-                        # We check if it has at least one triple as subject, meaning it's an entity
-                        for _ in graph.triples((obj, None, None)):
-                            collect_referenced_entities(obj, visited)
-                            break
-                
+                        elif obj not in visited and obj in spo:
+                            stack.append(obj)
+
                 return visited
             
             # Collect entities for NE: NE itself + all entities it references + all REs + entities REs reference
@@ -460,27 +597,25 @@ class TurtleParser:
             de_entities.add(de)
             de_entities.add(intent_node)  # Include original for triple collection
             
-            self._logger.debug(
-                "Found %d REs: %s",
-                len(re_list),
-                [str(re) for re in re_list]
-            )
-            
-            self._logger.debug(
-                "Entity collection: NE entities=%d (including %d REs), DE entities=%d (including %d REs)",
-                len(ne_entities),
-                len(re_list),
-                len(de_entities),
-                len(re_list)
-            )
-            if self._logger.isEnabledFor(logging.DEBUG):
-                self._logger.debug("NE entities: %s", [str(e) for e in sorted(ne_entities, key=str)])
-                self._logger.debug("DE entities: %s", [str(e) for e in sorted(de_entities, key=str)])
+            if debug_enabled:
+                self._logger.debug(
+                    "Found %d REs: %s",
+                    len(re_list),
+                    [str(re) for re in re_list]
+                )
+                self._logger.debug(
+                    "Entity collection: NE entities=%d (including %d REs), DE entities=%d (including %d REs)",
+                    len(ne_entities),
+                    len(re_list),
+                    len(de_entities),
+                    len(re_list)
+                )
+                self._logger.debug("NE entities: %s", [str(e) for e in sorted(ne_entities)])
+                self._logger.debug("DE entities: %s", [str(e) for e in sorted(de_entities)])
             
             # Helper function to collect all blank nodes connected to entities in the set
             def collect_connected_blank_nodes(entity_set: set) -> set:
                 """Collect all blank nodes that are connected to entities in the set."""
-                from rdflib import BNode
                 blank_nodes = set()
                 to_check = list(entity_set)
                 checked_entities = set()
@@ -493,7 +628,7 @@ class TurtleParser:
                     checked_entities.add(entity)
                     
                     # Get all triples where entity is subject
-                    for triple in graph.triples((entity, None, None)):
+                    for triple in spo.get(entity, ()):
                         _, _, obj = triple
                         # If object is a blank node, add it and traverse it
                         if isinstance(obj, BNode) and obj not in checked_blanks:
@@ -502,7 +637,7 @@ class TurtleParser:
                             to_check.append(obj)
                     
                     # Get all triples where entity is object
-                    for triple in graph.triples((None, None, entity)):
+                    for triple in ops.get(entity, ()):
                         subject, _, _ = triple
                         # If subject is a blank node, add it and traverse it
                         if isinstance(subject, BNode) and subject not in checked_blanks:
@@ -520,73 +655,35 @@ class TurtleParser:
             ne_blank_nodes = collect_connected_blank_nodes(ne_entities)
             de_blank_nodes = collect_connected_blank_nodes(de_entities)
             
-            # Helper function to check if a triple should be included (involves any of the entities or blank nodes)
-            def should_include_triple(triple, entity_set: set, blank_node_set: set) -> bool:
-                """Check if a triple involves any entity or blank node in the sets."""
-                from rdflib import BNode
-                subject, predicate, obj = triple
-                # Include if subject is in entity set
-                if isinstance(subject, URIRef) and subject in entity_set:
-                    return True
-                # Include if subject is a blank node in blank node set
-                if isinstance(subject, BNode) and subject in blank_node_set:
-                    return True
-                # Include if object is a URIRef in entity set
-                if isinstance(obj, URIRef) and obj in entity_set:
-                    return True
-                # Include if object is a blank node in blank node set
-                if isinstance(obj, BNode) and obj in blank_node_set:
-                    return True
-                return False
-            
             # Create graphs for NE and DE versions
-            ne_graph = Graph()
-            de_graph = Graph()
-            
-            # Copy all namespace bindings (ensure all prefixes are included)
-            # Also explicitly bind common prefixes that might be missing
-            common_prefixes = {
-                "data5g": "http://5g4data.eu/5g4data#",
-                "dct": "http://purl.org/dc/terms/",
-                "dcterms": "http://purl.org/dc/terms/",
-                "icm": "http://tio.models.tmforum.org/tio/v3.6.0/IntentCommonModel/",
-                "imo": "http://tio.models.tmforum.org/tio/v3.6.0/IntentManagementOntology/",
-                "log": "http://tio.models.tmforum.org/tio/v3.6.0/LogicalOperators/",
-                "quan": "http://tio.models.tmforum.org/tio/v3.6.0/QuantityOntology/",
-                "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
-                "set": "http://tio.models.tmforum.org/tio/v3.6.0/SetOperators/",
-                "xsd": "http://www.w3.org/2001/XMLSchema#",
-                "geo": "http://www.opengis.net/ont/geosparql#",
-            }
-            
-            for prefix, namespace in graph.namespaces():
-                ne_graph.bind(prefix, namespace, override=False)
-                de_graph.bind(prefix, namespace, override=False)
-            
-            # Also bind common prefixes explicitly to ensure they're included
-            for prefix, namespace in common_prefixes.items():
-                ne_graph.bind(prefix, namespace, override=False)
-                de_graph.bind(prefix, namespace, override=False)
+            ne_graph = Graph(store=self._GRAPH_STORE)
+            de_graph = Graph(store=self._GRAPH_STORE)
             
             # Add only relevant triples to each graph
-            # First, collect all triples that should be included
-            ne_triples_to_add = set()
-            de_triples_to_add = set()
-            
-            for triple in graph:
-                subject, predicate, obj = triple
-                
+            # Collect the triples that have one of the entities or connected blank nodes as
+            # subject or object straight from the indices, instead of filtering the whole graph
+            def collect_triples(nodes: set) -> set:
+                """Collect all triples whose subject or object is one of the given nodes."""
+                triples = set()
+                for node in nodes:
+                    triples.update(spo.get(node, ()))
+                    triples.update(ops.get(node, ()))
                 # Skip namespace/prefix triples (they're handled by bind)
-                if predicate == URIRef("http://www.w3.org/1999/02/22-rdf-syntax-ns#type") and str(obj) == "http://www.w3.org/2002/07/owl#Ontology":
-                    continue
-                
-                # For NE graph: include if involves NE entities or connected blank nodes
-                if should_include_triple(triple, ne_entities, ne_blank_nodes):
-                    ne_triples_to_add.add(triple)
-                
-                # For DE graph: include if involves DE entities or connected blank nodes
-                if should_include_triple(triple, de_entities, de_blank_nodes):
-                    de_triples_to_add.add(triple)
+                return {
+                    triple for triple in triples
+                    if not (triple[1] == RDF.type and str(triple[2]) == "http://www.w3.org/2002/07/owl#Ontology")
+                }
+            
+            ne_triples_to_add = collect_triples(ne_entities | ne_blank_nodes)
+            de_triples_to_add = collect_triples(de_entities | de_blank_nodes)
+            
+            # Copy only the namespace bindings the output graphs actually use
+            # (the source graph already carries the known prefixes)
+            source_namespaces = list(graph.namespaces())
+            for prefix, namespace in self._used_namespaces(source_namespaces, ne_triples_to_add):
+                ne_graph.bind(prefix, namespace, override=False)
+            for prefix, namespace in self._used_namespaces(source_namespaces, de_triples_to_add):
+                de_graph.bind(prefix, namespace, override=False)
             
             # Helper function to replace intent node in a triple
             def replace_intent_node(triple, old_node: URIRef, new_node: URIRef):
@@ -597,23 +694,43 @@ class TurtleParser:
                 return (new_subject, predicate, new_obj)
             
             # Add all collected triples, replacing the original intent_node with new ones
-            for triple in ne_triples_to_add:
-                new_triple = replace_intent_node(triple, intent_node, ne_intent_node)
-                ne_graph.add(new_triple)
-            for triple in de_triples_to_add:
-                new_triple = replace_intent_node(triple, intent_node, de_intent_node)
-                de_graph.add(new_triple)
-            
-            # Verify RE triples are included
-            for re_entity in re_list:
-                re_triples_ne = [t for t in ne_triples_to_add if t[0] == re_entity]
-                re_triples_de = [t for t in de_triples_to_add if t[0] == re_entity]
-                self._logger.debug(
-                    "RE %s: NE has %d triples, DE has %d triples",
-                    re_entity,
-                    len(re_triples_ne),
-                    len(re_triples_de)
-                )
+            # Only triples that have intent_node as subject or object need rewriting
+            # Each graph is filled with one batched addN call instead of per-triple add()
+            # The intent node's own handler, owner and log:allOf are never copied, since
+            # they are replaced with split-specific values below
+            intent_triples = set(spo.get(intent_node, ())) | set(ops.get(intent_node, ()))
+            copied_intent_triples = {
+                triple for triple in intent_triples
+                if not (triple[0] == intent_node and triple[1] in self._SPLIT_REPLACED_PREDICATES)
+            }
+            ne_quads = [(s, p, o, ne_graph) for s, p, o in ne_triples_to_add - intent_triples]
+            ne_quads.extend(
+                (*replace_intent_node(triple, intent_node, ne_intent_node), ne_graph)
+                for triple in ne_triples_to_add & copied_intent_triples
+            )
+            ne_graph.addN(ne_quads)
+            de_quads = [(s, p, o, de_graph) for s, p, o in de_triples_to_add - intent_triples]
+            de_quads.extend(
+                (*replace_intent_node(triple, intent_node, de_intent_node), de_graph)
+                for triple in de_triples_to_add & copied_intent_triples
+            )
+            de_graph.addN(de_quads)
+            
+            # Verify RE triples are included (bucket by subject once instead of scanning per RE)
+            if debug_enabled:
+                ne_by_subject = defaultdict(list)
+                for triple in ne_triples_to_add:
+                    ne_by_subject[triple[0]].append(triple)
+                de_by_subject = defaultdict(list)
+                for triple in de_triples_to_add:
+                    de_by_subject[triple[0]].append(triple)
+                for re_entity in re_list:
+                    self._logger.debug(
+                        "RE %s: NE has %d triples, DE has %d triples",
+                        re_entity,
+                        len(ne_by_subject.get(re_entity, ())),
+                        len(de_by_subject.get(re_entity, ()))
+                    )
             
             self._logger.debug(
                 "Triple collection: NE=%d triples (entities=%d, blanks=%d), DE=%d triples (entities=%d, blanks=%d)",
@@ -625,77 +742,59 @@ class TurtleParser:
                 len(de_blank_nodes)
             )
             
-            # Update Intent node properties for NE version (using new ne_intent_node)
-            imo_handler = URIRef("http://tio.models.tmforum.org/tio/v3.6.0/IntentManagementOntology/handler")
-            imo_owner = URIRef("http://tio.models.tmforum.org/tio/v3.6.0/IntentManagementOntology/owner")
-            data5g_derived_from = URIRef(f"{self.DATA5G_NS}derivedFrom")
-            
-            # Remove old handler and owner (from new intent node, which was copied from original)
-            ne_graph.remove((ne_intent_node, imo_handler, None))
-            ne_graph.remove((ne_intent_node, imo_owner, None))
-            # Set handler to "inNet" and owner to "inServ"
-            ne_graph.add((ne_intent_node, imo_handler, Literal("inNet")))
-            ne_graph.add((ne_intent_node, imo_owner, Literal("inServ")))
-            # Add provenance link to original combined intent
-            ne_graph.add((ne_intent_node, data5g_derived_from, intent_node))
-            
-            # Update Intent node properties for DE version (using new de_intent_node)
-            # Remove old handler and owner (from new intent node, which was copied from original)
-            de_graph.remove((de_intent_node, imo_handler, None))
-            de_graph.remove((de_intent_node, imo_owner, None))
-            # Set handler to "inOrch" and owner to "inServ"
-            de_graph.add((de_intent_node, imo_handler, Literal("inOrch")))
-            de_graph.add((de_intent_node, imo_owner, Literal("inServ")))
-            # Add provenance link to original combined intent
-            de_graph.add((de_intent_node, data5g_derived_from, intent_node))
-            
-            # Update log:allOf for NE version: include NE + all REs (using new ne_intent_node)
-            ne_allof = [ne] + re_list
-            self._logger.debug(
-                "NE log:allOf will include: NE=%s, REs=%s (total %d items)",
-                ne,
-                [str(re) for re in re_list],
-                len(ne_allof)
-            )
-            # Remove old log:allOf from intent in NE graph (from new intent node)
-            ne_graph.remove((ne_intent_node, log_allof, None))
-            # Add new log:allOf with NE and REs
-            for obj in ne_allof:
-                ne_graph.add((ne_intent_node, log_allof, obj))
+            # Update Intent node properties and log:allOf for NE version (using new ne_intent_node)
+            # log:allOf includes NE + all REs
+            if debug_enabled:
+                self._logger.debug(
+                    "NE log:allOf will include: NE=%s, REs=%s (total %d items)",
+                    ne,
+                    [str(re) for re in re_list],
+                    len(re_list) + 1
+                )
+            # Set handler to "inNet" and owner to "inServ", add provenance link to original
+            # combined intent and the new log:allOf with NE and REs, in one batch
+            ne_graph.addN([
+                (ne_intent_node, self._IMO_HANDLER, self._INNET, ne_graph),
+                (ne_intent_node, self._IMO_OWNER, self._INSERV, ne_graph),
+                (ne_intent_node, self._DERIVED_FROM, intent_node, ne_graph),
+                *((ne_intent_node, self._LOG_ALLOF, obj, ne_graph) for obj in chain((ne,), re_list)),
+            ])
             
             # Verify REs were added to log:allOf
-            ne_allof_actual = list(ne_graph.objects(ne_intent_node, log_allof))
-            self._logger.debug(
-                "NE log:allOf after update: %s",
-                [str(obj) for obj in ne_allof_actual]
-            )
+            if debug_enabled:
+                self._logger.debug(
+                    "NE log:allOf after update: %s",
+                    [str(obj) for obj in ne_graph.objects(ne_intent_node, self._LOG_ALLOF)]
+                )
             
-            # Update log:allOf for DE version: include DE + all REs (using new de_intent_node)
-            de_allof = [de] + re_list
-            self._logger.debug(
-                "DE log:allOf will include: DE=%s, REs=%s (total %d items)",
-                de,
-                [str(re) for re in re_list],
-                len(de_allof)
-            )
-            # Remove old log:allOf from intent in DE graph (from new intent node)
-            de_graph.remove((de_intent_node, log_allof, None))
-            # Add new log:allOf with DE and REs
-            for obj in de_allof:
-                de_graph.add((de_intent_node, log_allof, obj))
+            # Update Intent node properties and log:allOf for DE version (using new de_intent_node)
+            # log:allOf includes DE + all REs
+            if debug_enabled:
+                self._logger.debug(
+                    "DE log:allOf will include: DE=%s, REs=%s (total %d items)",
+                    de,
+                    [str(re) for re in re_list],
+                    len(re_list) + 1
+                )
+            # Set handler to "inOrch" and owner to "inServ", add provenance link to original
+            # combined intent and the new log:allOf with DE and REs, in one batch
+            de_graph.addN([
+                (de_intent_node, self._IMO_HANDLER, self._INORCH, de_graph),
+                (de_intent_node, self._IMO_OWNER, self._INSERV, de_graph),
+                (de_intent_node, self._DERIVED_FROM, intent_node, de_graph),
+                *((de_intent_node, self._LOG_ALLOF, obj, de_graph) for obj in chain((de,), re_list)),
+            ])
             
             # Verify REs were added to log:allOf
-            de_allof_actual = list(de_graph.objects(de_intent_node, log_allof))
-            self._logger.debug(
-                "DE log:allOf after update: %s",
-                [str(obj) for obj in de_allof_actual]
-            )
+            if debug_enabled:
+                self._logger.debug(
+                    "DE log:allOf after update: %s",
+                    [str(obj) for obj in de_graph.objects(de_intent_node, self._LOG_ALLOF)]
+                )
             
-            # Serialize to Turtle format
-            ne_serialized = ne_graph.serialize(format="turtle")
-            de_serialized = de_graph.serialize(format="turtle")
-            ne_turtle = ne_serialized.decode("utf-8") if isinstance(ne_serialized, bytes) else ne_serialized
-            de_turtle = de_serialized.decode("utf-8") if isinstance(de_serialized, bytes) else de_serialized
+            # Serialize to Turtle format (rdflib >= 6 returns str when no encoding is given)
+            ne_turtle = ne_graph.serialize(format="turtle")
+            de_turtle = de_graph.serialize(format="turtle")
             
             self._logger.info(
                 "Parsing: Split intent into NE version (%d triples, ID: %s) and DE version (%d triples, ID: %s)",
@@ -707,6 +806,12 @@ class TurtleParser:
             
             return (ne_turtle, de_turtle)
             
-        except Exception as exc:
-            self._logger.error("Failed to split Turtle intent: %s", exc, exc_info=True)
+        except self._PARSE_ERRORS as exc:
+            self._logger.error("Failed to split Turtle intent: %s", exc)
             raise ValueError(f"Cannot split intent: {str(exc)}") from exc
+
+
+@lru_cache(maxsize=128)
+def _split_turtle_intent_cached(turtle_data: str) -> Tuple[str, str]:
+    """Memoized TurtleParser split; failures raise and are therefore not cached."""
+    return TurtleParser()._split_turtle_intent(turtle_data)
@@ -1,28 +1,81 @@
 from __future__ import annotations
 
+import mmap
+import os
+import stat
 from pathlib import Path
 
+# Window after the cut point searched for a line boundary when tailing
+_LINE_ALIGN_WINDOW = 4096
+
 
 def tail_log_file(path: str, max_bytes: int = 256 * 1024) -> str:
     """Return up to the last ``max_bytes`` of the log file at ``path``.
 
     This reads from the end of the file backwards to avoid loading very large
-    files fully into memory.
+    files fully into memory. When the file is truncated, the returned text
+    starts at the first line boundary after the cut.
     """
-    log_path = Path(path)
+    max_bytes = max(1024, max_bytes)  # enforce a small sensible minimum
+
+    # Fast path: open/fstat/pread on the raw descriptor, no pathlib objects
+    # or buffered file wrapper. Falls back to the pathlib reader on any OS error.
+    if hasattr(os, "pread"):
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            pass
+        else:
+            try:
+                st = os.fstat(fd)
+                if stat.S_ISREG(st.st_mode):
+                    start = max(0, st.st_size - max_bytes)
+                    data = os.pread(fd, st.st_size - start, start)
+                    if start:
+                        data = data[_line_start(data, 0, len(data)):]
+                    return _decode_log(data, whole_file=not start)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+
+    return _tail_log_file_path(Path(path), max_bytes)
+
+
+def _tail_log_file_path(log_path: Path, max_bytes: int) -> str:
+    """pathlib/mmap implementation of :func:`tail_log_file`."""
     if not log_path.is_file():
         return f"Log file not found: {log_path}"
 
-    max_bytes = max(1024, max_bytes)  # enforce a small sensible minimum
-
     size = log_path.stat().st_size
     if size <= max_bytes:
         return log_path.read_text(errors="replace")
 
-    with log_path.open("rb") as f:
-        f.seek(-max_bytes, 2)  # seek from end
-        data = f.read()
+    with log_path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        size = len(mm)
+        start = _line_start(mm, max(0, size - max_bytes), size)
+        data = mm[start:size]
 
-    # Try to decode as UTF-8, replacing invalid sequences.
-    return data.decode("utf-8", errors="replace")
+    return _decode_log(data, whole_file=False)
 
+
+def _line_start(buf, start: int, end: int) -> int:
+    """Return the offset just after the first newline in ``buf`` at or after ``start``.
+
+    Only the first ``_LINE_ALIGN_WINDOW`` bytes are searched; ``start`` is returned
+    when there is no newline there. Starting at a line boundary means the first line
+    is not cut in half (and a multi-byte UTF-8 character is never split).
+    """
+    newline = buf.find(b"\n", start, min(start + _LINE_ALIGN_WINDOW, end))
+    return newline + 1 if newline != -1 else start
+
+
+def _decode_log(data: bytes, whole_file: bool) -> str:
+    """Decode log bytes as UTF-8, replacing invalid sequences.
+
+    A whole file gets the same newline translation as ``Path.read_text()``.
+    """
+    text = data.decode("utf-8", errors="replace")
+    if whole_file:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
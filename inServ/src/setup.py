@@ -1,3 +1,4 @@
+import os
 import sys
 from setuptools import setup, find_packages
 
@@ -17,6 +18,24 @@ REQUIRES = [
     "python_dateutil>=2.6.0"
 ]
 
+# Optional native Turtle parser; TurtleParser falls back to rdflib without it.
+# pyoxigraph.RdfFormat (used by the parser) needs 0.4.0 or later.
+EXTRAS_REQUIRE = {
+    "oxigraph": ["pyoxigraph>=0.4.0"],
+}
+
+# Optional ahead-of-time compilation of the RDF hot paths with Cython.
+# Opt in with INSERV_CYTHONIZE=1 (requires Cython and a C compiler); the
+# pure-Python module is used otherwise.
+EXT_MODULES = []
+if os.environ.get("INSERV_CYTHONIZE") == "1":
+    from Cython.Build import cythonize
+
+    EXT_MODULES = cythonize(
+        ["inserv/services/turtle_parser.py"],
+        compiler_directives={"language_level": 3},
+    )
+
 setup(
     name=NAME,
     version=VERSION,
@@ -25,7 +44,9 @@ setup(
     url="",
     keywords=["OpenAPI", "INTEND 5G4DATA use case; Intent Management API", "inServ"],
     install_requires=REQUIRES,
+    extras_require=EXTRAS_REQUIRE,
     packages=find_packages(),
+    ext_modules=EXT_MODULES,
     package_data={'': ['openapi/openapi.yaml']},
     include_package_data=True,
     entry_points={
@@ -1,18 +1,27 @@
 """Main entry point for Intent Generation MCP Server."""
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from intent_generation_mcp.server import get_mcp
 
-# Configure logging
+# Configure logging: request handlers only enqueue records, a background
+# listener thread writes them to stdout and the log file
+log_queue = queue.Queue(-1)
+log_listener = QueueListener(
+    log_queue,
+    logging.StreamHandler(sys.stdout),
+    logging.FileHandler('intent-generation-mcp-server.log'),
+)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('intent-generation-mcp-server.log')
-    ]
+    handlers=[QueueHandler(log_queue)]
 )
+log_listener.start()
+atexit.register(log_listener.stop)
 
 logger = logging.getLogger(__name__)
 
@@ -109,9 +109,7 @@ async def test_quantifier_operators(client, server_url):
         ("mean", "median")
     ]
     
-    for latency_op, bandwidth_op in operators:
-        print(f"\n--- Testing {latency_op} (latency) and {bandwidth_op} (bandwidth) ---")
-        
+    def make_slots(latency_op, bandwidth_op):
         slots = {
             "bandwidth": 300,
             "latency": 25,
@@ -129,20 +127,30 @@ async def test_quantifier_operators(client, server_url):
             slots["latency_end"] = 30
         if bandwidth_op == "inRange":
             slots["bandwidth_end"] = 400
-        
+        return slots
+    
+    # The operator combinations are independent, so send them concurrently
+    results = await asyncio.gather(*[
+        client.call_tool("generate_network_intent", {"slots": make_slots(latency_op, bandwidth_op)})
+        for latency_op, bandwidth_op in operators
+    ])
+    
+    # Quantifier names expected in each generated intent
+    needles = [(f"quan:{latency_op}", f"quan:{bandwidth_op}") for latency_op, bandwidth_op in operators]
+    
+    for (latency_op, bandwidth_op), (latency_needle, bandwidth_needle), result in zip(operators, needles, results):
+        print(f"\n--- Testing {latency_op} (latency) and {bandwidth_op} (bandwidth) ---")
         print(f"Parameters: latency_operator={latency_op}, bandwidth_operator={bandwidth_op}")
         
-        result = await client.call_tool("generate_network_intent", {"slots": slots})
-        
         if "generated_intent" in result.data:
             # Check if the generated intent contains the expected quantifier
             intent_text = result.data["generated_intent"]
-            if f"quan:{latency_op}" in intent_text:
+            if latency_needle in intent_text:
                 print(f"✅ Latency operator '{latency_op}' found in generated intent")
             else:
                 print(f"❌ Latency operator '{latency_op}' NOT found in generated intent")
                 
-            if f"quan:{bandwidth_op}" in intent_text:
+            if bandwidth_needle in intent_text:
                 print(f"✅ Bandwidth operator '{bandwidth_op}' found in generated intent")
             else:
                 print(f"❌ Bandwidth operator '{bandwidth_op}' NOT found in generated intent")
@@ -155,8 +163,7 @@ async def test_intent_types(client, server_url):
     """Test different intent types."""
     print("=== Test 3: Different Intent Types ===")
     
-    # Test Network Intent
-    print("\n--- Network Intent ---")
+    # Network Intent
     network_slots = {
         "bandwidth": 500,
         "latency": 20,
@@ -169,14 +176,7 @@ async def test_intent_types(client, server_url):
         "description": "Network slice for AR application"
     }
     
-    result = await client.call_tool("generate_network_intent", {"slots": network_slots})
-    if "generated_intent" in result.data:
-        print("✅ Network intent generated successfully")
-    else:
-        print(f"❌ Network intent failed: {result.data}")
-    
-    # Test Workload Intent
-    print("\n--- Workload Intent ---")
+    # Workload Intent
     workload_slots = {
         "compute_latency": 15,
         "compute_latency_operator": "smaller",
@@ -189,14 +189,7 @@ async def test_intent_types(client, server_url):
         "description": "Workload deployment for AR retail application"
     }
     
-    result = await client.call_tool("generate_workload_intent", {"slots": workload_slots})
-    if "generated_intent" in result.data:
-        print("✅ Workload intent generated successfully")
-    else:
-        print(f"❌ Workload intent failed: {result.data}")
-    
-    # Test Combined Intent
-    print("\n--- Combined Intent ---")
+    # Combined Intent
     combined_slots = {
         "bandwidth": 300,
         "latency": 20,
@@ -213,11 +206,33 @@ async def test_intent_types(client, server_url):
         "description": "Combined network and workload intent for VR gaming"
     }
     
-    result = await client.call_tool("generate_combined_intent", {"slots": combined_slots})
-    if "generated_intent" in result.data:
+    # The three intent types are independent, so generate them concurrently
+    network_result, workload_result, combined_result = await asyncio.gather(
+        client.call_tool("generate_network_intent", {"slots": network_slots}),
+        client.call_tool("generate_workload_intent", {"slots": workload_slots}),
+        client.call_tool("generate_combined_intent", {"slots": combined_slots}),
+    )
+    
+    # Test Network Intent
+    print("\n--- Network Intent ---")
+    if "generated_intent" in network_result.data:
+        print("✅ Network intent generated successfully")
+    else:
+        print(f"❌ Network intent failed: {network_result.data}")
+    
+    # Test Workload Intent
+    print("\n--- Workload Intent ---")
+    if "generated_intent" in workload_result.data:
+        print("✅ Workload intent generated successfully")
+    else:
+        print(f"❌ Workload intent failed: {workload_result.data}")
+    
+    # Test Combined Intent
+    print("\n--- Combined Intent ---")
+    if "generated_intent" in combined_result.data:
         print("✅ Combined intent generated successfully")
     else:
-        print(f"❌ Combined intent failed: {result.data}")
+        print(f"❌ Combined intent failed: {combined_result.data}")
     
     print()
 
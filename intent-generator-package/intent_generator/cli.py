@@ -18,6 +18,7 @@ def main():
     parser.add_argument("--output", type=str, help="Output file path (default: stdout)")
     parser.add_argument("--count", type=int, default=1, help="Number of intents to generate")
     parser.add_argument("--interval", type=float, default=0, help="Interval between generations (seconds)")
+    parser.add_argument("--format", choices=["turtle", "nt", "xml", "json-ld"], default="turtle", help="Output serialization format (default: turtle)")
     
     args = parser.parse_args()
     
@@ -30,10 +31,10 @@ def main():
         
         # Generate intent(s)
         if args.count > 1:
-            intents = generator.generate_sequence(args.type, params, args.count, args.interval)
+            intents = generator.generate_sequence(args.type, params, args.count, args.interval, args.format)
             output = "\n\n".join(intents)
         else:
-            output = generator.generate(args.type, params)
+            output = generator.generate(args.type, params, args.format)
         
         # Output result
         if args.output:
@@ -1,13 +1,17 @@
 """Utility functions for intent generation."""
 
+import functools
 import os
 from typing import Optional
 import openai
 
 
+@functools.lru_cache(maxsize=4096)
 def get_polygon_from_location(location: str, api_key: Optional[str] = None) -> str:
     """Get a polygon for a location using OpenAI API.
     
+    Successful lookups are cached per (location, api_key); failures are not cached.
+    
     Args:
         location: The location name to get polygon for
         api_key: OpenAI API key (if not provided, will use OPENAI_API_KEY env var)
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Setup script for intent-generator package."""
 
+import os
+
 from setuptools import setup, find_packages
 
 with open("README.md", "r", encoding="utf-8") as fh:
@@ -9,6 +11,18 @@ with open("README.md", "r", encoding="utf-8") as fh:
 with open("requirements.txt", "r", encoding="utf-8") as fh:
     requirements = [line.strip() for line in fh if line.strip() and not line.startswith("#")]
 
+# Optional ahead-of-time compilation of the generator with Cython.
+# Opt in with INTENT_GENERATOR_CYTHONIZE=1 (requires Cython and a C compiler);
+# the pure-Python module is used otherwise.
+ext_modules = []
+if os.environ.get("INTENT_GENERATOR_CYTHONIZE") == "1":
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        ["intent_generator/core.py"],
+        compiler_directives={"language_level": 3},
+    )
+
 setup(
     name="intent-generator",
     version="1.0.0",
@@ -19,6 +33,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/INTEND-Project/intent-generator",
     packages=find_packages(),
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -1,6 +1,15 @@
 """Tests for intent generator package."""
 
+import itertools
+import re
+import uuid
+from decimal import Decimal
+
 import pytest
+from rdflib import Graph
+from rdflib.compare import isomorphic
+
+from intent_generator import core
 from intent_generator import IntentGenerator, NetworkIntentParams, WorkloadIntentParams, CombinedIntentParams, IntentType
 
 
@@ -155,6 +164,46 @@ class TestIntentGenerator:
         assert len(intent_with_desc) > 0
 
 
+class TestTurtleOutput:
+    """Test that the Turtle text writer matches the rdflib path."""
+    
+    CASES = [
+        (IntentType.NETWORK, NetworkIntentParams(handler='h"x\n', owner="o", intent_description="d")),
+        (IntentType.NETWORK, {"latency": 5, "latency_operator": "inRange", "latency_end": 30, "my-throughput": 3, "my-throughput_operator": "larger"}),
+        (IntentType.WORKLOAD, WorkloadIntentParams(compute_latency_operator="inRange", compute_latency_end=9)),
+        (IntentType.COMBINED, CombinedIntentParams(latency_operator="inRange", latency_end=40, polygon="POLYGON((1 2, 3 4))")),
+    ]
+    
+    # Values the parameters accept that are not plain finite numbers
+    EDGE_VALUES = [float("inf"), float("-inf"), float("nan"), True, Decimal("Infinity"), Decimal("2"), "12", "abc", 1e-7, 10**20]
+    
+    def _generate_both(self, monkeypatch, intent_type, params):
+        """Generate with the text writer and the rdflib path from the same element IDs."""
+        results = []
+        for use_rdflib in (False, True):
+            ids = itertools.count()
+            monkeypatch.setattr(core.uuid, "uuid4", lambda: uuid.UUID(int=next(ids)))
+            generator = IntentGenerator(use_rdflib=use_rdflib, uuid_ids=True)
+            results.append(generator.generate(intent_type, params))
+        return results
+    
+    @pytest.mark.parametrize("intent_type,params", CASES)
+    def test_same_graph_as_rdflib(self, monkeypatch, intent_type, params):
+        """Test that both paths produce the same triples."""
+        text, rdflib_text = self._generate_both(monkeypatch, intent_type, params)
+        assert isomorphic(Graph().parse(data=text, format="turtle"), Graph().parse(data=rdflib_text, format="turtle"))
+    
+    @pytest.mark.filterwarnings("ignore")
+    @pytest.mark.parametrize("value", EDGE_VALUES)
+    def test_edge_values(self, monkeypatch, value):
+        """Test that non-finite, boolean and string values are written like the rdflib path writes them."""
+        params = CombinedIntentParams(latency=value, latency_operator="inRange", latency_end=value, bandwidth=value, compute_latency=value)
+        text, rdflib_text = self._generate_both(monkeypatch, IntentType.COMBINED, params)
+        values = re.findall(r"rdf:value (\S+)", text)
+        assert values and sorted(values) == sorted(re.findall(r"rdf:value (\S+)", rdflib_text))
+        assert isomorphic(Graph().parse(data=text, format="turtle"), Graph().parse(data=rdflib_text, format="turtle"))
+
+
 class TestParameterClasses:
     """Test cases for parameter classes."""
     